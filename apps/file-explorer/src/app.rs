@@ -1,13 +1,22 @@
 use eframe::egui;
 use std::fs;
+use std::io;
 use std::path::PathBuf;
+use std::sync::mpsc::{self, Receiver, TryRecvError};
+use std::thread;
 
 #[derive(Default)]
 pub struct FileItem {
     pub name: String,
+    /// Lowercased `name`, computed once at load for search and sorting.
+    pub name_lower: String,
+    /// Row text ("[D] name" / "[F] name"), built once at load.
+    pub label: String,
     pub path: PathBuf,
     pub is_dir: bool,
-    pub size: u64,
+    /// Size in bytes; `None` until the entry is first selected, so listing a
+    /// directory costs no per-entry stat.
+    pub size: Option<u64>,
 }
 
 pub struct FileExplorerApp {
@@ -18,10 +27,17 @@ pub struct FileExplorerApp {
     pub selected_index: Option<usize>,
     pub error_message: Option<String>,
     pub allowed_paths: Vec<PathBuf>,
+    /// Result of the in-flight directory scan, if any. Replacing it drops the
+    /// receiver, so a superseded scan's result is discarded.
+    pending_load: Option<Receiver<(Vec<FileItem>, Option<String>)>>,
+    /// In-flight size lookup for the selected entry, keyed by its path.
+    pending_size: Option<(PathBuf, Receiver<io::Result<u64>>)>,
+    /// Handle used by worker threads to wake the UI when their result is ready.
+    ctx: egui::Context,
 }
 
-impl Default for FileExplorerApp {
-    fn default() -> Self {
+impl FileExplorerApp {
+    pub fn new(ctx: egui::Context) -> Self {
         let root_path = std::env::var("ROOT_PATH")
             .map(PathBuf::from)
             .unwrap_or_else(|_| PathBuf::from("/"));
@@ -31,33 +47,65 @@ impl Default for FileExplorerApp {
             .unwrap_or_default();
 
         let current_path = root_path.clone();
-        let (items, error_message) = load_directory(&current_path);
+        let pending_load = Some(spawn_load(current_path.clone(), ctx.clone()));
         Self {
             search_query: String::new(),
             root_path,
             current_path,
-            items,
+            items: Vec::new(),
             selected_index: None,
-            error_message,
+            error_message: None,
             allowed_paths,
+            pending_load,
+            pending_size: None,
+            ctx,
         }
     }
 }
 
+/// Scan `path` on a worker thread so slow filesystems don't block the UI.
+fn spawn_load(path: PathBuf, ctx: egui::Context) -> Receiver<(Vec<FileItem>, Option<String>)> {
+    let (tx, rx) = mpsc::channel();
+    thread::spawn(move || {
+        // The receiver is gone if another navigation superseded this one.
+        if let Ok(listing) = std::panic::catch_unwind(|| load_directory(&path)) {
+            let _ = tx.send(listing);
+        }
+        // Drop the sender first so a panicked scan shows up as Disconnected.
+        drop(tx);
+        ctx.request_repaint();
+    });
+    rx
+}
+
+/// Stat `path` on a worker thread; a hung mount must not freeze the frame.
+fn spawn_stat(path: PathBuf, ctx: egui::Context) -> Receiver<io::Result<u64>> {
+    let (tx, rx) = mpsc::channel();
+    thread::spawn(move || {
+        let _ = tx.send(fs::symlink_metadata(&path).map(|m| m.len()));
+        ctx.request_repaint();
+    });
+    rx
+}
+
 fn load_directory(path: &PathBuf) -> (Vec<FileItem>, Option<String>) {
     match fs::read_dir(path) {
         Ok(entries) => {
             let mut items: Vec<FileItem> = entries
                 .filter_map(|entry| entry.ok())
                 .map(|entry| {
-                    let metadata = entry.metadata().ok();
-                    let is_dir = metadata.as_ref().map(|m| m.is_dir()).unwrap_or(false);
-                    let size = metadata.as_ref().map(|m| m.len()).unwrap_or(0);
+                    // file_type() comes from the readdir d_type on most filesystems,
+                    // so listing needs no stat; sizes are fetched on selection.
+                    let is_dir = entry.file_type().map(|t| t.is_dir()).unwrap_or(false);
+                    let name = entry.file_name().to_string_lossy().into_owned();
+                    let icon = if is_dir { "[D]" } else { "[F]" };
                     FileItem {
-                        name: entry.file_name().to_string_lossy().into_owned(),
+                        name_lower: name.to_lowercase(),
+                        label: format!("{} {}", icon, name),
+                        name,
                         path: entry.path(),
                         is_dir,
-                        size,
+                        size: None,
                     }
                 })
                 .collect();
@@ -65,7 +113,7 @@ fn load_directory(path: &PathBuf) -> (Vec<FileItem>, Option<String>) {
             items.sort_by(|a, b| {
                 b.is_dir
                     .cmp(&a.is_dir)
-                    .then(a.name.to_lowercase().cmp(&b.name.to_lowercase()))
+                    .then_with(|| a.name_lower.cmp(&b.name_lower))
             });
             (items, None)
         }
@@ -101,19 +149,83 @@ impl FileExplorerApp {
             self.error_message = Some(format!("Access denied: {}", path.display()));
             return;
         }
-        let (items, err) = load_directory(&path);
+        self.pending_load = Some(spawn_load(path.clone(), self.ctx.clone()));
         self.current_path = path;
-        self.items = items;
-        self.error_message = err;
+        self.items.clear();
+        self.error_message = None;
         self.selected_index = None;
+        self.pending_size = None;
         self.search_query.clear();
     }
+
+    /// Select `idx`, looking up its size in the background if not yet known.
+    fn select(&mut self, idx: usize) {
+        self.selected_index = Some(idx);
+        self.pending_size = match self.items.get(idx) {
+            Some(item) if item.size.is_none() => Some((
+                item.path.clone(),
+                spawn_stat(item.path.clone(), self.ctx.clone()),
+            )),
+            _ => None,
+        };
+    }
+
+    /// Store the pending size lookup once it completes. Failures are not
+    /// cached, so selecting the entry again retries.
+    fn poll_size(&mut self) {
+        let Some((path, rx)) = &self.pending_size else {
+            return;
+        };
+        match rx.try_recv() {
+            Ok(result) => {
+                if let Ok(len) = result {
+                    if let Some(item) = self.items.iter_mut().find(|i| &i.path == path) {
+                        item.size = Some(len);
+                    }
+                }
+                self.pending_size = None;
+            }
+            Err(TryRecvError::Empty) => {}
+            Err(TryRecvError::Disconnected) => {
+                self.pending_size = None;
+            }
+        }
+    }
+
+    /// Install the pending scan result once the worker has finished.
+    fn poll_load(&mut self) {
+        let Some(rx) = &self.pending_load else {
+            return;
+        };
+        match rx.try_recv() {
+            Ok((mut items, err)) => {
+                // Hide items outside allowed_paths once here rather than
+                // re-checking every row on every frame.
+                if !self.allowed_paths.is_empty() {
+                    items.retain(|item| self.is_accessible(&item.path));
+                }
+                self.items = items;
+                self.error_message = err;
+                self.pending_load = None;
+            }
+            // Still scanning; the worker requests a repaint when it's done.
+            Err(TryRecvError::Empty) => {}
+            Err(TryRecvError::Disconnected) => {
+                // The worker exited without a result (e.g. it panicked).
+                self.error_message =
+                    Some(format!("Failed to load {}", self.current_path.display()));
+                self.pending_load = None;
+            }
+        }
+    }
 }
 
 impl eframe::App for FileExplorerApp {
     fn update(&mut self, ctx: &egui::Context, _frame: &mut eframe::Frame) {
         // Hide the mouse cursor
         ctx.set_cursor_icon(egui::CursorIcon::None);
+        self.poll_load();
+        self.poll_size();
         egui::CentralPanel::default().show(ctx, |ui| {
             ui.heading("File Explorer");
             ui.separator();
@@ -138,34 +250,32 @@ impl eframe::App for FileExplorerApp {
             });
             ui.separator();
 
+            if self.pending_load.is_some() {
+                ui.label("Loading...");
+            }
+
             egui::ScrollArea::vertical().show(ui, |ui| {
                 let mut navigate_to: Option<PathBuf> = None;
+                let mut select: Option<usize> = None;
+                let query = self.search_query.to_lowercase();
 
                 for (idx, item) in self.items.iter().enumerate() {
-                    if !self.search_query.is_empty()
-                        && !item
-                            .name
-                            .to_lowercase()
-                            .contains(&self.search_query.to_lowercase())
-                    {
-                        continue;
-                    }
-                    // Hide items outside allowed_paths when ALLOWED_PATHS is set
-                    if !self.allowed_paths.is_empty() && !self.is_accessible(&item.path) {
+                    if !query.is_empty() && !item.name_lower.contains(&query) {
                         continue;
                     }
                     let is_selected = self.selected_index == Some(idx);
-                    let icon = if item.is_dir { "[D]" } else { "[F]" };
-                    let label = format!("{} {}", icon, item.name);
-                    let response = ui.selectable_label(is_selected, &label);
+                    let response = ui.selectable_label(is_selected, &item.label);
                     if response.clicked() {
-                        self.selected_index = Some(idx);
+                        select = Some(idx);
                     }
                     if response.double_clicked() && item.is_dir {
                         navigate_to = Some(item.path.clone());
                     }
                 }
 
+                if let Some(idx) = select {
+                    self.select(idx);
+                }
                 if let Some(path) = navigate_to {
                     self.navigate(path);
                 }
@@ -175,10 +285,12 @@ impl eframe::App for FileExplorerApp {
             if let Some(idx) = self.selected_index {
                 if let Some(item) = self.items.get(idx) {
                     let kind = if item.is_dir { "directory" } else { "file" };
-                    ui.label(format!(
-                        "Selected: {} ({}, {} bytes)",
-                        item.name, kind, item.size
-                    ));
+                    let size = match item.size {
+                        Some(size) => format!("{} bytes", size),
+                        None if self.pending_size.is_some() => "...".to_string(),
+                        None => "size unavailable".to_string(),
+                    };
+                    ui.label(format!("Selected: {} ({}, {})", item.name, kind, size));
                 }
             }
             if let Some(ref err) = self.error_message {
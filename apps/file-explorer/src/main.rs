@@ -22,6 +22,6 @@ fn main() -> eframe::Result {
     eframe::run_native(
         "File Explorer",
         options,
-        Box::new(|_cc| Ok(Box::new(app::FileExplorerApp::default()))),
+        Box::new(|cc| Ok(Box::new(app::FileExplorerApp::new(cc.egui_ctx.clone())))),
     )
 }
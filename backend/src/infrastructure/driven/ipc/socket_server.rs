@@ -23,10 +23,12 @@ impl IpcSocketServer {
 
     /// Start the IPC socket server
     pub async fn start(&self) -> Result<()> {
-        // Remove existing socket file if it exists
-        if self.socket_path.exists() {
-            std::fs::remove_file(&self.socket_path)
-                .context("Failed to remove existing socket file")?;
+        // Remove existing socket file if it exists (one unlink, no exists() probe)
+        match std::fs::remove_file(&self.socket_path) {
+            Err(e) if e.kind() != std::io::ErrorKind::NotFound => {
+                return Err(e).context("Failed to remove existing socket file");
+            }
+            _ => {}
         }
 
         let listener = UnixListener::bind(&self.socket_path)
@@ -65,8 +67,10 @@ impl IpcSocketServer {
         // Spawn task to send messages to app
         tokio::spawn(async move {
             while let Some(msg) = rx_from_backend.recv().await {
-                if let Ok(json) = serde_json::to_string(&msg) {
-                    if let Err(e) = writer.write_all(format!("{}\n", json).as_bytes()).await {
+                if let Ok(mut json) = serde_json::to_vec(&msg) {
+                    // Terminate in place so each message goes out in a single write
+                    json.push(b'\n');
+                    if let Err(e) = writer.write_all(&json).await {
                         error!("Failed to write to app: {}", e);
                         break;
                     }
@@ -77,19 +81,19 @@ impl IpcSocketServer {
             debug!("App writer task ended");
         });
 
-        // Read messages from app
-        let mut line = String::new();
+        // Read messages from app as raw bytes; serde_json validates UTF-8 itself
+        let mut line = Vec::new();
         let session_id: Option<String> = None;
 
         loop {
             line.clear();
-            match reader.read_line(&mut line).await {
+            match reader.read_until(b'\n', &mut line).await {
                 Ok(0) => {
                     info!("App disconnected");
                     break;
                 }
                 Ok(_) => {
-                    match serde_json::from_str::<AppMessage>(&line) {
+                    match serde_json::from_slice::<AppMessage>(&line) {
                         Ok(msg) => {
                             debug!("Received from app: {:?}", msg);
 
@@ -123,7 +127,11 @@ impl IpcSocketServer {
                             }
                         }
                         Err(e) => {
-                            error!("Failed to parse message from app: {} - Line: {}", e, line);
+                            error!(
+                                "Failed to parse message from app: {} - Line: {}",
+                                e,
+                                String::from_utf8_lossy(&line)
+                            );
                         }
                     }
                 }
@@ -149,9 +157,7 @@ impl IpcSocketServer {
 
 impl Drop for IpcSocketServer {
     fn drop(&mut self) {
-        // Clean up socket file
-        if self.socket_path.exists() {
-            let _ = std::fs::remove_file(&self.socket_path);
-        }
+        // Clean up socket file; a missing file is not an error here
+        let _ = std::fs::remove_file(&self.socket_path);
     }
 }
@@ -73,23 +73,89 @@ pub enum LogLevel {
 }
 
 /// Helper module for base64 encoding/decoding with serde
+///
+/// Encoding streams through `collect_str` and decoding works on the borrowed
+/// input, so neither direction holds a full-size intermediate base64 `String`
+/// next to the payload.
 mod base64_serde {
-    use serde::{Deserialize, Deserializer, Serializer};
+    use base64::{display::Base64Display, engine::general_purpose::STANDARD, Engine};
+    use serde::de::{self, Visitor};
+    use serde::{Deserializer, Serializer};
+    use std::fmt;
 
     pub fn serialize<S>(bytes: &[u8], serializer: S) -> Result<S::Ok, S::Error>
     where
         S: Serializer,
     {
-        use base64::{engine::general_purpose::STANDARD, Engine};
-        serializer.serialize_str(&STANDARD.encode(bytes))
+        serializer.collect_str(&Base64Display::new(bytes, &STANDARD))
     }
 
     pub fn deserialize<'de, D>(deserializer: D) -> Result<Vec<u8>, D::Error>
     where
         D: Deserializer<'de>,
     {
-        use base64::{engine::general_purpose::STANDARD, Engine};
-        let s = String::deserialize(deserializer)?;
-        STANDARD.decode(&s).map_err(serde::de::Error::custom)
+        deserializer.deserialize_str(Base64Visitor)
+    }
+
+    struct Base64Visitor;
+
+    impl<'de> Visitor<'de> for Base64Visitor {
+        type Value = Vec<u8>;
+
+        fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+            f.write_str("a base64 encoded string")
+        }
+
+        fn visit_str<E>(self, v: &str) -> Result<Self::Value, E>
+        where
+            E: de::Error,
+        {
+            STANDARD.decode(v).map_err(E::custom)
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_upload_file_base64_round_trip() {
+        let data: Vec<u8> = (0..=255u8).cycle().take(1000).collect();
+        let msg = PlatformMessage::UploadFile {
+            filename: "blob.bin".to_string(),
+            data: data.clone(),
+        };
+
+        let json = serde_json::to_string(&msg).unwrap();
+        assert!(json.contains(r#""type":"upload-file""#));
+
+        match serde_json::from_str::<PlatformMessage>(&json).unwrap() {
+            PlatformMessage::UploadFile {
+                filename,
+                data: decoded,
+            } => {
+                assert_eq!(filename, "blob.bin");
+                assert_eq!(decoded, data);
+            }
+            other => panic!("unexpected message: {:?}", other),
+        }
+    }
+
+    #[test]
+    fn test_download_data_base64_encoding() {
+        let msg = AppMessage::DownloadData {
+            filename: "a.txt".to_string(),
+            data: b"hello".to_vec(),
+        };
+
+        let json = serde_json::to_string(&msg).unwrap();
+        assert!(json.contains(r#""data":"aGVsbG8=""#));
+    }
+
+    #[test]
+    fn test_invalid_base64_is_rejected() {
+        let json = r#"{"type":"upload-file","filename":"x","data":"not base64!"}"#;
+        assert!(serde_json::from_str::<PlatformMessage>(json).is_err());
     }
 }